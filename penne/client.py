@@ -24,7 +24,7 @@ def thread_function(loop: asyncio.AbstractEventLoop, client: Client):
         print(f"Connection terminated: {e}")
 
 
-def create_client(address: str, custom_delegate_hash: dict[str, Delegate] = {}, on_connected: Callable=None):
+def create_client(address: str, custom_delegate_hash: dict[str, Delegate] = None, on_connected: Callable=None):
     """Create a client object and start background thread
 
     Args:
@@ -44,8 +44,11 @@ def create_client(address: str, custom_delegate_hash: dict[str, Delegate] = {},
     if address_parts.scheme not in ["ws", "wss"]:
         raise ValueError("Address given must be a websocket!")
 
+    if custom_delegate_hash is None:
+        custom_delegate_hash = {}
+
     loop = asyncio.new_event_loop()
-    
+
 
     # Create client instance and thread
     client = Client(address, loop, custom_delegate_hash, on_connected)
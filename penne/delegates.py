@@ -96,9 +96,8 @@ def inject_methods(delegate: Delegate, methods: list):
             list of method id's to inject
     """
 
-    # Clear out old injected methods
-    for name in dir(delegate):
-        att = getattr(delegate, name)
+    # Clear out old injected methods - they only live in the instance dict
+    for name, att in list(vars(delegate).items()):
         if hasattr(att, "injected"):
             print(f"Deleting: {name} in inject methods")
             delattr(delegate, name)
@@ -128,11 +127,9 @@ def inject_signals(delegate: Delegate, signals: list[list[int]]):
     """
 
     state_signals = delegate._client.state["signals"]
-    injected_signals = {}
     for id in signals:
         signal: SignalDelegate = state_signals[tuple(id)]
-        injected_signals[signal.info.name] = None
-    delegate.signals = injected_signals
+        delegate.signals.setdefault(signal.info.name, None)
 
 
 
@@ -154,21 +151,11 @@ class MethodDelegate(Delegate):
             mapping specifier to context for method invocation
     """
 
-    def __init__(self, client: Client, message: Message, specifier: str):
-        self._client = client
-        self.info = message
-        self.specifier = specifier
-        self.context_map = {
-            "tables": "table",
-            "plots": "plot",
-            "entities": "entity"
-        }
-
-    def on_new(self, message: Message):
-        pass
-
-    def on_remove(self, message: Message):
-        pass
+    context_map = {
+        "tables": "table",
+        "plots": "plot",
+        "entities": "entity"
+    }
 
     def invoke(self, on_delegate: Delegate, args=None, callback=None):
         """Invoke this delegate's method
@@ -189,10 +176,9 @@ class MethodDelegate(Delegate):
     def __repr__(self) -> str:
         """Custom string representation for methods"""
         
-        rep = f"{self.info.name}:\n\t{self.info.doc}\n\tReturns: {self.info.return_doc}\n\tArgs:"
-        for arg in self.info.arg_doc:
-            rep += f"\n\t\t{arg.name}: {arg.doc}"
-        return rep
+        info = self.info
+        args = "".join(f"\n\t\t{arg.name}: {arg.doc}" for arg in info.arg_doc)
+        return f"{info.name}:\n\t{info.doc}\n\tReturns: {info.return_doc}\n\tArgs:{args}"
 
 
 class SignalDelegate(Delegate):
@@ -203,25 +189,17 @@ class SignalDelegate(Delegate):
             client delegate is a part of 
         info (message): 
             message containing information on the signal
-        specifier (str): 
+        specifier (str):
             keyword for specifying the type of delegate
     """
-    
-    def __init__(self, client: Client, message: Message, specifier: str):
-        self._client = client
-        self.info = message
-        self.specifier = specifier
-
-    def on_new(self, message: Message):
-        pass
-
-    def on_remove(self, message: Message): 
-        pass
+    pass
 
 
 class SelectionRange(tuple):
     """Selection of range of rows"""
 
+    __slots__ = ()
+
     def __new__(cls, key_from: int, key_to: int):
         return super().__new__(SelectionRange, (key_from, key_to))
 
@@ -238,13 +216,15 @@ class Selection(object):
             ranges of selected rows
     """
 
+    __slots__ = ("name", "rows", "row_ranges")
+
     def __init__(self, name: str, rows: list[int] = None, row_ranges: list[SelectionRange] = None):
         self.name = name
         self.rows = rows
         self.row_ranges = row_ranges
 
     def __repr__(self) -> str:
-        return f"Selection Object({self.__dict__})"
+        return f"Selection Object(name: {self.name}, rows: {self.rows}, row_ranges: {self.row_ranges})"
 
     def __getitem__(self, attribute):
         return getattr(self, attribute)
@@ -271,26 +251,30 @@ class TableDelegate(Delegate):
             id group for delegate in state and table on server
     """
 
+    # Signal name mapped to the method handling it, bound per instance
+    _builtin_signals = {
+        "noo::tbl_reset" : "_reset_table",
+        "noo::tbl_rows_removed" : "_remove_rows",
+        "noo::tbl_updated" : "_update_rows",
+        "noo::tbl_selection_updated" : "_update_selection"
+    }
+
+    # Specify public methods
+    __all__ = [
+        "subscribe",
+        "request_clear",
+        "request_insert",
+        "request_remove",
+        "request_update",
+        "request_update_selection",
+        "plot"
+    ]
+
     def __init__(self, client: Client, message: Message, specifier: str):
         super().__init__(client, message, specifier)
         self.name = "Table Delegate"
         self.selections = {}
-        self.signals = {
-            "tbl_reset" : self._reset_table,
-            "tbl_rows_removed" : self._remove_rows,
-            "tbl_updated" : self._update_rows,
-            "tbl_selection_updated" : self._update_selection
-        }
-        # Specify public methods 
-        self.__all__ = [
-            "subscribe", 
-            "request_clear", 
-            "request_insert", 
-            "request_remove", 
-            "request_update", 
-            "request_update_selection",
-            "plot"
-        ]
+        self.signals = {name: getattr(self, attr) for name, attr in self._builtin_signals.items()}
         self.plotting = None
 
 
@@ -304,8 +288,8 @@ class TableDelegate(Delegate):
         """
 
         # Extract data from init info and transpose rows to cols
-        row_data = getattr(init_info, "data")
-        cols = getattr(init_info, "columns")
+        row_data = init_info.data
+        cols = init_info.columns
         print(f"Table Initialized with cols: {cols} and row data: {row_data}")
 
 
@@ -361,19 +345,6 @@ class TableDelegate(Delegate):
         print(f"Made selection {selection_obj.name} = {selection_obj}")
 
 
-    def _relink_signals(self):
-        """Relink the signals for built in methods
-
-        These should always be linked, along with whatever is injected,
-        so relink on new and on update messages
-        """
-
-        self.signals["noo::tbl_reset"] = self._reset_table
-        self.signals["noo::tbl_rows_removed"] = self._remove_rows
-        self.signals["noo::tbl_updated"] = self._update_rows
-        self.signals["noo::tbl_selection_updated"] = self._update_selection
-
-
     def on_new(self, message: Message):
         """Handler when create message is received
 
@@ -393,18 +364,7 @@ class TableDelegate(Delegate):
 
         # Reset
         self._reset_table()
-        self._relink_signals()
-
 
-    def on_update(self, message: Message):
-        """Handler when update message is received
-        
-        Args:
-            message (Message): update message with the new table's info
-        """
-
-        self._relink_signals()
-    
 
     def on_remove(self, message: Message):
         pass
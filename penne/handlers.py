@@ -2,12 +2,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from penne.delegates import Delegate
-    from penne.messages import Message
     from penne.core import Client
 
-import weakref
-
-from . import messages
+from .messages import Message
 
 # Helper Methods
 def handle_update(client, message: Message, specifier: str):
@@ -73,19 +70,16 @@ def handle(client: Client, id, message_dict):
     handle_info = client.server_message_map[id]
     action = handle_info.action
     specifier = handle_info.specifier
-    message_obj: Message = messages.Message.from_dict(message_dict)
+    message_obj: Message = Message.from_dict(message_dict)
 
     if specifier == "plots":
         print(f"\n  {action} - {specifier}\n{message_obj}")
-    
+
     # Update state based on map info
     if action == "create":
 
         # Create instance of delegate
-        specifier = specifier
-        reference = weakref.ref(client)
-        reference_obj = reference()
-        delegate: Delegate = client.delegates[specifier](reference_obj, message_obj, specifier)
+        delegate: Delegate = client.delegates[specifier](client, message_obj, specifier)
 
         # Update state and pass message info to the delegate's handler
         client.state[specifier][message_obj.id] = delegate
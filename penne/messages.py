@@ -5,64 +5,102 @@ class Message(object):
     """Generic Message Class for casting messages sent from server
 
     Attributes:
-        dynamically added to each instance using the from dict method
+        _data (dict) : mapping attribute names to values,
+            filled in using the from dict method
     """
 
+    __slots__ = ("_data",)
+
+    def __init__(self):
+        self._data = {}
+
     @classmethod
     def from_dict(cls, raw_dict: dict[str, Any]):
         """Function to generate generic message objects
-        
-        Recursively catches nested structures
+
+        Catches nested structures using an explicit work stack
+        instead of recursing
 
         Parameters:
             raw_dict (dict) : dict to be cast as message object
         """
 
-        processed_dict = {}
-        for key, value in raw_dict.items():
+        obj = cls()
+        stack = [(obj._data, raw_dict)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
 
-            # Recursive case
-            if isinstance(value, dict):
-                processed_dict[key] = cls.from_dict(value)
-
-            # Recursive case for list of objects
-            elif value and isinstance(value, list) and isinstance(value[0], dict):
-                obj_list = []
-                for nested_dict in value:
-                    obj_list.append(cls.from_dict(nested_dict))
-                processed_dict[key] = obj_list
-            
-            # Cast ID's to tuples - careful could be off - list of two values
-            elif isinstance(value, list) and len(value) == 2:
-                processed_dict[key] = tuple(value)
+                # Exact type checks - values come straight from the decoder
+                value_type = type(value)
 
-            else:
-                processed_dict[key] = value
+                # Nested message case
+                if value_type is dict:
+                    child = cls()
+                    target[key] = child
+                    stack.append((child._data, value))
+
+                elif value_type is list and value:
+
+                    # Nested case for list of objects
+                    if type(value[0]) is dict:
+                        obj_list = []
+                        for nested_dict in value:
+                            child = cls()
+                            obj_list.append(child)
+                            stack.append((child._data, nested_dict))
+                        target[key] = obj_list
+
+                    # Cast ID's to tuples - careful could be off - list of two values
+                    elif len(value) == 2:
+                        target[key] = tuple(value)
+
+                    else:
+                        target[key] = value
+
+                else:
+                    target[key] = value
 
-        obj = cls()
-        obj.__dict__.update(processed_dict)
         return obj
-    
+
 
     def as_dict(self):
         """Get dictionary representation of class"""
 
-        rep = self.__dict__
-        for key, value in rep.items():
+        data = self._data
+
+        # Fast path - nothing nested, no need to rebuild the dict
+        for value in data.values():
+            if isinstance(value, Message):
+                break
+        else:
+            return data
+
+        rep = {}
+        for key, value in data.items():
 
             # Recursive case
             if isinstance(value, Message):
                 rep[key] = value.as_dict()
+            else:
+                rep[key] = value
 
         return rep
 
 
+    def __getattr__(self, __name: str):
+        try:
+            return self._data[__name]
+        except KeyError:
+            raise AttributeError(__name)
+
+
     def __getitem__(self, __name: str):
         return getattr(self, __name)
 
 
     def __repr__(self):
-        return f"{self.__dict__}"
+        return f"{self._data}"
 
 
 class HandleInfo(object):
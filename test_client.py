@@ -3,6 +3,7 @@ import unittest
 import time
 import multiprocessing
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -15,11 +16,11 @@ def get_plot_data(df: pd.DataFrame):
     """Helper function to extract data for the plot from the dataframe"""
 
     data = {
-        "xs": df["x"], 
-        "ys": df["y"], 
+        "xs": df["x"],
+        "ys": df["y"],
         "zs": df["z"],
-        "s" : [(((sx + sy + sz) / 3) * 1000) for sx, sy, sz in zip(df["sx"], df["sy"], df["sz"])],
-        "c" : [(r, g, b) for r, g, b in zip(df["r"], df["g"], df["b"])]
+        "s" : ((df["sx"] + df["sy"] + df["sz"]) / 3) * 1000,
+        "c" : np.column_stack((df["r"], df["g"], df["b"]))
     }
     return data
 
@@ -82,6 +83,9 @@ class TestDelegate(TableDelegate):
     def __init__(self, client, message, specifier) -> None:
         super().__init__(client, message, specifier)
         self.dataframe: pd.DataFrame = None
+        self._headers = None
+        self._pending_rows: list[list] = []
+        self._pending_keys: list[int] = []
 
     def _on_table_init(self, init_info, on_done=None):
         """Creates table from server response info
@@ -93,12 +97,13 @@ class TestDelegate(TableDelegate):
         """
 
         # Extract data from init info and transpose rows to cols
-        row_data = getattr(init_info, "data")
+        row_data = init_info.data
         col_data = [list(i) for i in zip(*row_data)]
-        cols = getattr(init_info, "columns")
-        data_dict = {getattr(col, "name"): data for col, data in zip(cols, col_data)}
-        
-        self.dataframe = pd.DataFrame(data_dict, index=getattr(init_info, "keys"))
+        cols = init_info.columns
+        data_dict = {col.name: data for col, data in zip(cols, col_data)}
+
+        self.dataframe = pd.DataFrame(data_dict, index=init_info.keys)
+        self._headers = self.dataframe.columns.values
 
         # Initialize selections if any
         selections = getattr(init_info, "selections", [])
@@ -117,6 +122,9 @@ class TestDelegate(TableDelegate):
 
         self.dataframe = pd.DataFrame()
         self.selections = {}
+        self._headers = self.dataframe.columns.values
+        self._pending_rows = []
+        self._pending_keys = []
 
         if self.plotting:
             self._update_plot()
@@ -131,7 +139,8 @@ class TestDelegate(TableDelegate):
             key_list (list): list of keys corresponding to rows to be removed
         """
 
-        self.dataframe.drop(index=key_list, inplace=True)
+        self._flush_pending()
+        self.dataframe = self.dataframe.drop(index=key_list)
         print(f"Removed Rows: {key_list}...\n", self.dataframe)
 
         if self.plotting:
@@ -151,47 +160,82 @@ class TestDelegate(TableDelegate):
                 should be col for each col in table, and value for each key
         """
 
+        # Flush first if any incoming key is still sitting in the buffer
+        if self._pending_keys and not set(keys).isdisjoint(self._pending_keys):
+            self._flush_pending()
+
+        # Split into existing rows and brand new ones
+        index = self.dataframe.index
+        existing_keys, existing_rows = [], []
         for key, row in zip(keys, rows):
-            self.dataframe.loc[key] = row
+            if key in index:
+                existing_keys.append(key)
+                existing_rows.append(row)
+            else:
+                self._pending_keys.append(key)
+                self._pending_rows.append(row)
+
+        # Overwrite existing rows in one vectorized assignment
+        if existing_keys:
+            self.dataframe.loc[existing_keys] = existing_rows
 
         if self.plotting:
             self._update_plot()
-    
+
         print(f"Updated Rows...{keys}\n", self.dataframe)
 
 
+    def _flush_pending(self):
+        """Materialize buffered rows into the dataframe
+
+        New rows are buffered on insert so each one doesn't pay for a
+        full copy of the dataframe, then appended here in one concat
+        """
+
+        if not self._pending_rows:
+            return
+
+        new_df = pd.DataFrame(self._pending_rows, columns=self._headers, index=self._pending_keys)
+        self.dataframe = pd.concat([self.dataframe, new_df])
+        self._pending_rows = []
+        self._pending_keys = []
+
+
     def get_selection(self, name: str):
         """Get a selection object and construct Dataframe representation
 
         Args:
             name (str) : name of selection object to get
         """
+        self._flush_pending()
+
         # Try to retrieve selection object from instance or return blank frame
-        try:
-            sel_obj = self.selections[name]
-        except:
-            return pd.DataFrame(columns=self.dataframe.columns)
+        sel_obj = self.selections.get(name)
+        if sel_obj is None:
+            return pd.DataFrame(columns=self._headers)
 
-        frames = []
+        # Build one boolean mask over the index for rows and ranges
+        index = self.dataframe.index.values
+        mask = np.zeros(len(index), dtype=bool)
 
         # Get rows already in that selection
         if sel_obj.rows:
-            frames.append(self.dataframe.loc[sel_obj["rows"]])
+            mask |= np.isin(index, sel_obj["rows"])
 
         # Uses ranges in object to get other rows
         if sel_obj.row_ranges:
-            ranges = sel_obj["row_ranges"]
-            for r in ranges:
-                frames.append(self.dataframe.loc[r[0]:r[1]-1])
+            for key_from, key_to in sel_obj["row_ranges"]:
+                mask |= (index >= key_from) & (index < key_to)
 
-        # Return frames concatenated
-        df = pd.concat(frames)
+        # Return rows selected by the mask
+        df = self.dataframe.iloc[np.flatnonzero(mask)]
         print(f"Got selection for {sel_obj}\n{df}")
         return df
 
     def _update_plot(self):
         """Update plotting process when dataframe is updated"""
 
+        self._flush_pending()
         df = self.dataframe
         self.sender.send(get_plot_data(df))
 
@@ -201,6 +245,7 @@ class TestDelegate(TableDelegate):
         Uses matplotlib to plot a representation of the table
         """
 
+        self._flush_pending()
         self.sender, receiver = multiprocessing.Pipe()
 
         self.plotting=multiprocessing.Process(target=plot_process, args=(self.dataframe, receiver))